@@ -2,12 +2,16 @@
  * Tests for JSONL Parser
  */
 
-import { describe, it, expect } from 'vitest';
+import { promises as fs } from 'fs';
+import os from 'os';
+import path from 'path';
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
 import {
   transformToMessages,
   getSessionMetadata,
   filterMessagesSince,
   extractProjectPath,
+  readProjectPathFromJsonl,
   getFirstUserMessagePreview,
   type RawJsonlEntry,
   type UserJsonlEntry,
@@ -385,6 +389,54 @@ describe('extractProjectPath', () => {
   });
 });
 
+// ============================================================
+// readProjectPathFromJsonl Tests
+// ============================================================
+
+describe('readProjectPathFromJsonl', () => {
+  let tmpDir: string;
+
+  beforeEach(async () => {
+    tmpDir = await fs.mkdtemp(path.join(os.tmpdir(), 'jsonl-parser-test-'));
+  });
+
+  afterEach(async () => {
+    await fs.rm(tmpDir, { recursive: true, force: true });
+  });
+
+  const writeJsonl = async (lines: string[]): Promise<string> => {
+    const filePath = path.join(tmpDir, 'session.jsonl');
+    await fs.writeFile(filePath, lines.join('\n') + '\n');
+    return filePath;
+  };
+
+  it('returns the first cwd in the file', async () => {
+    const filePath = await writeJsonl([
+      JSON.stringify({ type: 'file-history-snapshot' }),
+      JSON.stringify(createUserEntry({ cwd: '/Users/test/first' })),
+      JSON.stringify(createAssistantEntry({ cwd: '/Users/test/second' })),
+    ]);
+
+    expect(await readProjectPathFromJsonl(filePath)).toBe('/Users/test/first');
+  });
+
+  it('skips blank and malformed lines', async () => {
+    const filePath = await writeJsonl([
+      '',
+      '{not json',
+      JSON.stringify(createUserEntry({ cwd: '/Users/test/project' })),
+    ]);
+
+    expect(await readProjectPathFromJsonl(filePath)).toBe('/Users/test/project');
+  });
+
+  it('returns null if no entry has cwd', async () => {
+    const filePath = await writeJsonl([JSON.stringify({ ...createUserEntry(), cwd: undefined })]);
+
+    expect(await readProjectPathFromJsonl(filePath)).toBeNull();
+  });
+});
+
 // ============================================================
 // getFirstUserMessagePreview Tests
 // ============================================================
@@ -5,7 +5,8 @@
  * Located in ~/.claude/projects/[encoded-path]/[session-id].jsonl
  */
 
-import { promises as fs } from 'fs';
+import { createReadStream, promises as fs } from 'fs';
+import { createInterface } from 'readline';
 import { logger } from './logger.js';
 
 // ============================================================
@@ -238,6 +239,9 @@ function extractToolUse(content: string | ContentBlock[]): ToolUseEvent[] {
  */
 export function transformToMessages(entries: RawJsonlEntry[], sessionId: string): Message[] {
   const messages: Message[] = [];
+  // JSONL is appended in write order, so messages usually arrive sorted
+  let needsSort = false;
+  let prevTime = -Infinity;
 
   for (const entry of entries) {
     // Filter out entries that shouldn't be shown
@@ -269,11 +273,21 @@ export function transformToMessages(entries: RawJsonlEntry[], sessionId: string)
         timestamp: new Date(assistantEntry.timestamp),
         toolUse: toolUse.length > 0 ? toolUse : undefined,
       });
+    } else {
+      continue;
+    }
+
+    const time = messages[messages.length - 1].timestamp.getTime();
+    if (!(time >= prevTime)) {
+      needsSort = true;
     }
+    prevTime = time;
   }
 
-  // Sort by timestamp (chronological order)
-  messages.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+  // Sort by timestamp (chronological order), only when something is out of order
+  if (needsSort) {
+    messages.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+  }
 
   return messages;
 }
@@ -337,6 +351,43 @@ export function extractProjectPath(entries: RawJsonlEntry[]): string | null {
   return null;
 }
 
+/**
+ * Read the project path (first cwd) straight from a JSONL file
+ *
+ * Streams the file line by line and stops at the first entry with a cwd,
+ * which is almost always on the first line or two, instead of reading and
+ * parsing the whole session the way parseJsonlFile + extractProjectPath do.
+ * Malformed lines are skipped.
+ *
+ * @param filePath - Absolute path to the JSONL file
+ * @returns The project path, or null if no entry has one
+ */
+export async function readProjectPathFromJsonl(filePath: string): Promise<string | null> {
+  const stream = createReadStream(filePath, { encoding: 'utf-8' });
+  const lines = createInterface({ input: stream, crlfDelay: Infinity });
+
+  try {
+    for await (const rawLine of lines) {
+      const line = rawLine.trim();
+      if (!line) continue;
+
+      try {
+        const entry = JSON.parse(line) as RawJsonlEntry;
+        if ('cwd' in entry && entry.cwd) {
+          return entry.cwd;
+        }
+      } catch {
+        // Skip malformed lines
+      }
+    }
+  } finally {
+    lines.close();
+    stream.destroy();
+  }
+
+  return null;
+}
+
 /**
  * Clean preview text by removing XML-like tags (e.g., <ide_opened_file>)
  * and other non-human-readable content.
@@ -17,7 +17,7 @@ import {
 import {
   parseJsonlFile,
   getSessionMetadata,
-  extractProjectPath,
+  readProjectPathFromJsonl,
   getFirstUserMessagePreview,
 } from '../lib/jsonlParser.js';
 import { getGitHubRepoUrl } from './gitService.js';
@@ -164,8 +164,7 @@ export async function scanProjects(): Promise<Project[]> {
         if (projectPath) break;
         const filePath = path.join(projectDirPath, file);
         try {
-          const jsonlEntries = await parseJsonlFile(filePath);
-          projectPath = extractProjectPath(jsonlEntries);
+          projectPath = await readProjectPathFromJsonl(filePath);
         } catch {
           // Ignore errors, try next file
         }
@@ -266,8 +265,7 @@ export async function getProject(encodedPath: string): Promise<Project | null> {
     if (projectPath) break;
     const filePath = path.join(projectDirPath, file);
     try {
-      const jsonlEntries = await parseJsonlFile(filePath);
-      projectPath = extractProjectPath(jsonlEntries);
+      projectPath = await readProjectPathFromJsonl(filePath);
     } catch {
       // Ignore errors, try next file
     }
@@ -342,8 +340,7 @@ export async function getSessionsForProject(
       if (decodedProjectPath) break;
       const filePath = path.join(projectDirPath, file);
       try {
-        const entries = await parseJsonlFile(filePath);
-        decodedProjectPath = extractProjectPath(entries) ?? undefined;
+        decodedProjectPath = (await readProjectPathFromJsonl(filePath)) ?? undefined;
       } catch {
         // Ignore errors, try next file
       }